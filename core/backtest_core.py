@@ -0,0 +1,47 @@
+"""Signal-processing kernels for `core.trader.run_backtest`.
+
+`signal_events(sig)` takes an int8 signal array (1 buy, -1 sell, 0 hold)
+and returns the bar indices where the backtest acts together with the side
+of each action. When numba is installed the plain per-bar state machine is
+JIT-compiled to native code; otherwise an equivalent NumPy formulation is
+used, so numba stays an optional dependency.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _signal_events_loop(sig):
+    # scalar state machine: act whenever the non-zero signal changes
+    n = sig.shape[0]
+    idx = np.empty(n, dtype=np.int64)
+    side = np.empty(n, dtype=np.int8)
+    k = 0
+    last = 0
+    for i in range(n):
+        s = sig[i]
+        if s != 0 and s != last:
+            idx[k] = i
+            side[k] = s
+            k += 1
+            last = s
+    return idx[:k], side[:k]
+
+
+def _signal_events_numpy(sig):
+    # hold the last non-zero signal forward (0 before the first one); the
+    # bars where that held state changes are exactly the trade events.
+    n = len(sig)
+    last_nz = np.maximum.accumulate(np.where(sig != 0, np.arange(n), 0))
+    state = sig[last_nz]
+    events = np.flatnonzero(np.diff(state, prepend=np.int8(0)))
+    return events, state[events]
+
+
+if njit is not None:
+    signal_events = njit(cache=True)(_signal_events_loop)
+else:
+    signal_events = _signal_events_numpy
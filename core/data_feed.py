@@ -1,3 +1,7 @@
+import time
+from functools import lru_cache
+
+import numpy as np
 import yfinance as yf
 from nsetools import Nse
 
@@ -11,6 +15,14 @@ _INDEX_MAP = {
     'SENSEX': '^BSESN',
 }
 
+# precomputed normalizations: index aliases plus the index tickers
+# themselves, so the common inputs resolve with a single dict lookup
+_NORM = {v: v for v in _INDEX_MAP.values()}
+_NORM.update(_INDEX_MAP)
+
+# reverse lookup (yfinance index ticker -> short name) for nsetools quotes
+_REV_INDEX_MAP = {v: k for k, v in _INDEX_MAP.items()}
+
 
 def _normalize_ticker(symbol: str) -> str:
     """Return a ticker string that yfinance understands.
@@ -22,19 +34,31 @@ def _normalize_ticker(symbol: str) -> str:
     - Otherwise, append the NSE suffix '.NS' for regular equity tickers.
     """
     s = symbol.strip().upper()
-    if s in _INDEX_MAP:
-        return _INDEX_MAP[s]
-    if s.startswith('^') or '.' in s:
+    v = _NORM.get(s)
+    if v is not None:
+        return v
+    if s[:1] == '^' or '.' in s:
         return s
     return f"{s}.NS"
 
 
-def get_historical_data(symbol: str, period="3mo", interval="1h"):
-    """Fetch historical data (yfinance). Returns a DataFrame or None on failure."""
-    ticker = _normalize_ticker(symbol)
-    try:
-        df = yf.download(ticker, period=period, interval=interval)
-    except Exception:
+def _select_ticker(big, ticker: str, n_tickers: int):
+    """Pull one ticker's columns out of a (possibly multi-ticker) download."""
+    cols = big.columns
+    if getattr(cols, 'nlevels', 1) > 1:
+        # group_by='ticker' puts the ticker on level 0, but older yfinance
+        # releases use level 1; accept either.
+        for level in range(cols.nlevels):
+            if ticker in cols.get_level_values(level):
+                return big.xs(ticker, axis=1, level=level).copy()
+        return None
+    # flat columns: only unambiguous for a single-ticker download
+    return big if n_tickers == 1 else None
+
+
+def _flatten(df):
+    """Normalize one ticker's frame; returns None when there is no data."""
+    if df is None:
         return None
 
     # yfinance may return MultiIndex columns when a ticker is provided; e.g.
@@ -47,11 +71,72 @@ def get_historical_data(symbol: str, period="3mo", interval="1h"):
         # if anything goes wrong, fall back to returning raw df
         pass
 
-    if df is None or df.empty:
+    # bars that exist only for other tickers in a batch come back all-NaN
+    df = df.dropna(how='all')
+    if df.empty:
         return None
+
+    # float32 is plenty for signal generation and halves the memory the
+    # strategies stream through. Volume stays as-is: float32 can't hold
+    # large share counts exactly.
+    for c in ('Open', 'High', 'Low', 'Close', 'Adj Close'):
+        if c in df.columns:
+            df[c] = df[c].astype(np.float32)
     return df
 
 
+@lru_cache(maxsize=256)
+def _download(tickers: tuple, period: str, interval: str, hour_bucket: int):
+    """Download `tickers` in one request and split per ticker; memoized per hour.
+
+    Returns a dict mapping each ticker to its DataFrame (None when Yahoo had
+    no data for it). `hour_bucket` only exists to expire cache entries:
+    callers pass the current hour so a key goes stale once the hour rolls
+    over. Raises when nothing at all came back so that lru_cache never
+    memoizes a failed request.
+    """
+    big = yf.download(list(tickers), period=period, interval=interval, group_by='ticker', threads=True)
+    if big is None or big.empty:
+        raise LookupError(f"no data returned for {' '.join(tickers)}")
+    frames = {t: _flatten(_select_ticker(big, t, len(tickers))) for t in tickers}
+    if all(df is None for df in frames.values()):
+        raise LookupError(f"no data returned for {' '.join(tickers)}")
+    return frames
+
+
+def get_historical_many(symbols, period="3mo", interval="1h"):
+    """Fetch historical data for several symbols with a single yfinance request.
+
+    Returns a dict mapping each input symbol to a DataFrame, or None when no
+    data was available for it. Results are cached in-process for the
+    current clock hour, so repeated calls (e.g. Streamlit reruns) skip the
+    network. Each frame is a copy so strategies that add columns don't
+    modify the cached data.
+    """
+    symbols = list(symbols)
+    tickers = {s: _normalize_ticker(s) for s in symbols}
+    hour_bucket = int(time.time() // 3600)
+    try:
+        frames = _download(tuple(sorted(set(tickers.values()))), period, interval, hour_bucket)
+    except Exception:
+        return {s: None for s in symbols}
+
+    out = {}
+    for s in symbols:
+        df = frames.get(tickers[s])
+        out[s] = None if df is None else df.copy()
+    return out
+
+
+def get_historical_data(symbol: str, period="3mo", interval="1h"):
+    """Fetch historical data (yfinance). Returns a DataFrame or None on failure.
+
+    Thin wrapper over `get_historical_many` for a single symbol, so it
+    shares the same hourly cache.
+    """
+    return get_historical_many([symbol], period=period, interval=interval)[symbol]
+
+
 def get_live_price(symbol: str):
     """Get live NSE quote (delayed) via nsetools (returns last traded price).
 
@@ -63,11 +148,10 @@ def get_live_price(symbol: str):
     # If user passed an index ticker like '^NSEI', map it back to a recognizable
     # index name where possible (best-effort).
     s = symbol.strip().upper()
-    # reverse-lookup index short names
-    rev_map = {v: k for k, v in _INDEX_MAP.items()}
     try:
-        if s in rev_map:
-            qsym = rev_map[s]
+        # reverse-lookup index short names
+        if s in _REV_INDEX_MAP:
+            qsym = _REV_INDEX_MAP[s]
         elif s.endswith('.NS'):
             qsym = s.replace('.NS', '')
         else:
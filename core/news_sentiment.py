@@ -1,37 +1,79 @@
+import asyncio
 import re
+import string
 from typing import List, Dict
 import yfinance as yf
-import urllib.request
+import requests
+from requests.adapters import HTTPAdapter
 import urllib.parse
 import xml.etree.ElementTree as ET
 from typing import Any
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional
+    ahocorasick = None
 
-POSITIVE_WORDS = {
+
+POSITIVE_WORDS = frozenset({
     'gain', 'gains', 'up', 'surge', 'surges', 'beat', 'beats', 'upgrade', 'upgraded',
     'record', 'strong', 'positive', 'outperform', 'outperformance', 'benefit', 'benefits',
     'profit', 'profits', 'win', 'wins'
-}
+})
 
-NEGATIVE_WORDS = {
+NEGATIVE_WORDS = frozenset({
     'drop', 'drops', 'down', 'fall', 'falls', 'decline', 'declines', 'miss', 'misses',
     'downgrade', 'downgraded', 'weak', 'negative', 'underperform', 'loss', 'losses', 'halt'
-}
+})
+
+# compiled once at import; `_score_headline` runs for every headline scored
+_WORD_RE = re.compile(r'[a-zA-Z0-9]+')
+
+# word -> score lookup so each token costs a single dict probe
+_WORD_SCORE: Dict[str, int] = {w: 1 for w in POSITIVE_WORDS}
+_WORD_SCORE.update({w: -1 for w in NEGATIVE_WORDS})
+
+# characters that make up a token (see `_WORD_RE`); used to reject
+# automaton matches that sit inside a longer word
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits)
 
 
-def _tokenize(text: str) -> List[str]:
-    # simple tokenization: split on non-alphanumeric
-    return [t for t in re.split(r'[^a-zA-Z0-9]+', text.lower()) if t]
+def _build_automaton():
+    """Aho-Corasick automaton over the sentiment terms (value: (len, score))."""
+    automaton = ahocorasick.Automaton()
+    for w, score in _WORD_SCORE.items():
+        automaton.add_word(w, (len(w), score))
+    automaton.make_automaton()
+    return automaton
+
+
+# when pyahocorasick is installed, scan each headline once with a DFA
+# instead of tokenizing it; scales to large (and multi-word) term lists.
+_AUTOMATON = _build_automaton() if ahocorasick is not None else None
+
+# shared HTTP session so repeated RSS queries reuse keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per request.
+_HTTP = requests.Session()
+_HTTP.headers.update({"User-Agent": "Mozilla/5.0"})
+_HTTP.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
 
 
 def _score_headline(headline: str) -> int:
-    tokens = _tokenize(headline)
+    text = headline.lower()
+    if _AUTOMATON is None:
+        # tokenize (runs of alphanumerics) and score in a single pass
+        return sum(_WORD_SCORE.get(m.group(0), 0) for m in _WORD_RE.finditer(text))
+
     score = 0
-    for t in tokens:
-        if t in POSITIVE_WORDS:
-            score += 1
-        if t in NEGATIVE_WORDS:
-            score -= 1
+    last = len(text) - 1
+    for end, (length, value) in _AUTOMATON.iter(text):
+        start = end - length + 1
+        # only count whole tokens: 'up' must not match inside 'upgraded'
+        if start > 0 and text[start - 1] in _WORD_CHARS:
+            continue
+        if end < last and text[end + 1] in _WORD_CHARS:
+            continue
+        score += value
     return score
 
 
@@ -40,14 +82,13 @@ def _fetch_google_news(query: str, max_headlines: int = 5) -> List[str]:
 
     This is a lightweight fallback when yfinance.news is empty. It performs a
     search query on Google News RSS and returns a list of headline strings.
-    Uses only stdlib (urllib, xml.etree) to avoid new dependencies.
+    Requests go through the module-level pooled `_HTTP` session.
     """
     q = urllib.parse.quote_plus(query)
     url = f"https://news.google.com/rss/search?q={q}&hl=en-IN&gl=IN&ceid=IN:en"
-    headers = {"User-Agent": "Mozilla/5.0"}
-    req = urllib.request.Request(url, headers=headers)
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = resp.read()
+    resp = _HTTP.get(url, timeout=10)
+    resp.raise_for_status()
+    data = resp.content
     try:
         root = ET.fromstring(data)
     except Exception:
@@ -71,6 +112,9 @@ def _fetch_google_news(query: str, max_headlines: int = 5) -> List[str]:
 # dashboard session. Keyed by query string.
 _RSS_CACHE: Dict[str, List[str]] = {}
 
+# upper bound on symbols fetched at once by `get_news_sentiment_many`
+CONCURRENCY_LIMIT = 8
+
 
 def get_news_sentiment(symbol: str, max_headlines: int = 5) -> Dict:
     """Fetch recent news for `symbol` and return a simple sentiment score.
@@ -209,3 +253,23 @@ def get_news_sentiment(symbol: str, max_headlines: int = 5) -> Dict:
         'headline_scores': headline_scores,
         'events': events,
     }
+
+
+async def get_news_sentiment_many(symbols: List[str], max_headlines: int = 5) -> Dict[str, Dict]:
+    """Fetch news sentiment for several symbols concurrently.
+
+    Every symbol still goes through `get_news_sentiment`, run on a worker
+    thread so the blocking yfinance/RSS round-trips overlap instead of
+    running back to back. At most `CONCURRENCY_LIMIT` symbols are in flight
+    at once. Returns a dict mapping each symbol to its sentiment dict.
+
+    Usage from sync code: `asyncio.run(get_news_sentiment_many(symbols))`.
+    """
+    semaphore = asyncio.Semaphore(CONCURRENCY_LIMIT)
+
+    async def _one(symbol: str) -> Dict:
+        async with semaphore:
+            return await asyncio.to_thread(get_news_sentiment, symbol, max_headlines)
+
+    results = await asyncio.gather(*(_one(s) for s in symbols))
+    return dict(zip(symbols, results))
@@ -1,8 +1,50 @@
+import numbers
+
+import numpy as np
+from pandas import Index, Series
+
+
 class Portfolio:
     def __init__(self, cash=100000):
         self.cash = float(cash)
         self.position = 0.0
-        self.trade_log = []
+        self._cash0 = self.cash
+        # trade log stored as parallel arrays (struct-of-arrays) grown by
+        # doubling; `trade_log` rebuilds the list-of-tuples view on demand.
+        # Dates stay as the caller's objects so tz-aware timestamps survive.
+        # Cash/position after each trade feed `equity_curve`.
+        self._cap = 64
+        self._n = 0
+        self._log_date = np.empty(self._cap, dtype=object)
+        self._log_side = np.empty(self._cap, dtype=np.int8)
+        self._log_price = np.empty(self._cap, dtype=np.float64)
+        self._log_cash = np.empty(self._cap, dtype=np.float64)
+        self._log_pos = np.empty(self._cap, dtype=np.float64)
+
+    def _log_trade(self, date, side, price):
+        """Append one trade (side +1 = BUY, -1 = SELL) to the log arrays."""
+        if self._n == self._cap:
+            self._cap *= 2
+            self._log_date = np.resize(self._log_date, self._cap)
+            self._log_side = np.resize(self._log_side, self._cap)
+            self._log_price = np.resize(self._log_price, self._cap)
+            self._log_cash = np.resize(self._log_cash, self._cap)
+            self._log_pos = np.resize(self._log_pos, self._cap)
+        self._log_date[self._n] = date
+        self._log_side[self._n] = side
+        self._log_price[self._n] = price
+        self._log_cash[self._n] = self.cash
+        self._log_pos[self._n] = self.position
+        self._n += 1
+
+    @property
+    def trade_log(self):
+        """List of (date, "BUY"|"SELL", price) tuples in execution order."""
+        n = self._n
+        return [
+            (d, "BUY" if side > 0 else "SELL", float(p))
+            for d, side, p in zip(self._log_date[:n], self._log_side[:n], self._log_price[:n])
+        ]
 
     def _to_scalar(self, v):
         """Coerce a price-like value to a Python float scalar.
@@ -10,20 +52,13 @@ class Portfolio:
         Accepts numbers, numpy scalars/arrays of size 1, and pandas Series of
         length 1. Raises ValueError for longer arrays/series.
         """
-        import numbers
-        try:
-            # pandas Series
-            from pandas import Series
-        except Exception:
-            Series = None
-
-        try:
-            import numpy as np
-        except Exception:
-            np = None
+        # fast path: plain Python / numpy float scalars (what the backtester feeds)
+        t = type(v)
+        if t is float or t is np.float64 or t is int:
+            return float(v)
 
         # pandas Series
-        if Series is not None and isinstance(v, Series):
+        if isinstance(v, Series):
             if v.shape == ():
                 return float(v.item())
             if len(v) == 1:
@@ -31,7 +66,7 @@ class Portfolio:
             raise ValueError("Expected scalar price, got Series with length>1")
 
         # numpy arrays / scalars
-        if np is not None and isinstance(v, (np.ndarray,)):
+        if isinstance(v, np.ndarray):
             if v.size == 1:
                 return float(v.item())
             raise ValueError("Expected scalar price, got ndarray with size>1")
@@ -51,15 +86,39 @@ class Portfolio:
         if self.position == 0:
             self.position = self.cash / p
             self.cash = 0.0
-            self.trade_log.append((date, "BUY", p))
+            self._log_trade(date, 1, p)
 
     def sell(self, price, date):
         p = self._to_scalar(price)
         if self.position > 0:
             self.cash = self.position * p
             self.position = 0.0
-            self.trade_log.append((date, "SELL", p))
+            self._log_trade(date, -1, p)
 
     def value(self, current_price):
         p = self._to_scalar(current_price)
         return float(self.cash + self.position * p)
+
+    def equity_curve(self, prices, dates=None):
+        """Portfolio value at every bar of `prices`, computed in one vectorized pass.
+
+        `dates` are the bar timestamps matching `prices` (defaults to
+        `prices.index` for a pandas Series and is required for a plain
+        ndarray). Each bar is valued with the cash/position in effect after
+        all trades dated at or before it. Returns a float64 ndarray the same
+        length as `prices`.
+        """
+        if dates is None:
+            dates = getattr(prices, "index", None)
+            if dates is None:
+                raise ValueError("Expected `dates` for prices without an index (e.g. a plain ndarray)")
+        prices = np.asarray(prices, dtype=np.float64)
+        n = self._n
+        if n:
+            k = Index(self._log_date[:n]).searchsorted(Index(dates), side="right")
+        else:
+            k = np.zeros(len(prices), dtype=np.intp)
+        # slot 0 holds the starting state; slot i the state after trade i-1
+        cash = np.concatenate(([self._cash0], self._log_cash[:n]))
+        pos = np.concatenate(([0.0], self._log_pos[:n]))
+        return cash[k] + pos[k] * prices
@@ -0,0 +1,49 @@
+"""Rolling-window helpers shared by the strategy modules.
+
+Each helper takes a 1-D NumPy array and returns a NumPy array of the same
+length and dtype with NaN for the first `window - 1` entries, matching
+`pandas.Series.rolling(window).<op>()`. Bottleneck's C moving-window
+kernels are used when it is installed; otherwise the helpers fall back to
+pandas, so bottleneck stays an optional dependency. Bottleneck rejects
+windows longer than the series, so those also go through pandas and come
+back all-NaN.
+"""
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional
+    bn = None
+
+
+def move_mean(values, window):
+    # accumulated in float64 like move_std: a float32 running sum drifts with
+    # series length and price level, enough to flip crossover signals
+    if bn is not None and window <= len(values):
+        out = bn.move_mean(values.astype(np.float64), window)
+    else:
+        out = pd.Series(values, dtype=np.float64).rolling(window).mean().to_numpy()
+    return out.astype(values.dtype, copy=False)
+
+
+def move_std(values, window):
+    # sample std (ddof=1) to match pandas' rolling std. Always accumulated
+    # in float64: the running sums lose most of their precision in float32.
+    if bn is not None and window <= len(values):
+        out = bn.move_std(values.astype(np.float64), window, ddof=1)
+    else:
+        out = pd.Series(values, dtype=np.float64).rolling(window).std().to_numpy()
+    return out.astype(values.dtype, copy=False)
+
+
+def move_max(values, window):
+    if bn is not None and window <= len(values):
+        return bn.move_max(values, window)
+    return pd.Series(values).rolling(window).max().to_numpy(dtype=values.dtype)
+
+
+def move_min(values, window):
+    if bn is not None and window <= len(values):
+        return bn.move_min(values, window)
+    return pd.Series(values).rolling(window).min().to_numpy(dtype=values.dtype)
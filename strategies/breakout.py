@@ -1,6 +1,10 @@
+import numpy as np
+
+from strategies._rolling import move_max, move_min
+
 def apply(df, lookback=20):
-    df["High_Max"] = df["High"].rolling(lookback).max()
-    df["Low_Min"] = df["Low"].rolling(lookback).min()
+    df["High_Max"] = move_max(df["High"].to_numpy(dtype=np.float32), lookback)
+    df["Low_Min"] = move_min(df["Low"].to_numpy(dtype=np.float32), lookback)
     df["Signal"] = 0
     df.loc[df["Close"] > df["High_Max"].shift(1), "Signal"] = 1
     df.loc[df["Close"] < df["Low_Min"].shift(1), "Signal"] = -1
@@ -1,9 +1,64 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+
+def _macd_signal(close, a12, a26, a9, out):
+    # One pass computing EMA12, EMA26, the MACD line and its EMA9 signal
+    # line. Each EMA keeps a weighted sum and weight total so the result
+    # matches pandas' `ewm(span=...).mean()` (adjust=True) exactly,
+    # including the warm-up bars and NaN gaps in `close`.
+    n12 = d12 = n26 = d26 = n9 = d9 = 0.0
+    for i in range(close.shape[0]):
+        x = close[i]
+        n12 *= 1.0 - a12
+        d12 *= 1.0 - a12
+        n26 *= 1.0 - a26
+        d26 *= 1.0 - a26
+        if x == x:
+            n12 += x
+            d12 += 1.0
+            n26 += x
+            d26 += 1.0
+        m = n12 / d12 - n26 / d26 if d12 > 0.0 else np.nan
+        n9 *= 1.0 - a9
+        d9 *= 1.0 - a9
+        if m == m:
+            n9 += m
+            d9 += 1.0
+        sig = n9 / d9 if d9 > 0.0 else np.nan
+        if m > sig:
+            out[i] = 1
+        elif m < sig:
+            out[i] = -1
+        else:
+            out[i] = 0
+
+
+if njit is not None:
+    _macd_signal = njit(cache=True)(_macd_signal)
+
+
+def _macd_signal_pandas(df):
+    ema12 = df["Close"].ewm(span=12).mean()
+    ema26 = df["Close"].ewm(span=26).mean()
+    macd = ema12 - ema26
+    signal_line = macd.ewm(span=9).mean()
+    out = np.zeros(len(df), dtype=np.int8)
+    out[(macd > signal_line).to_numpy()] = 1
+    out[(macd < signal_line).to_numpy()] = -1
+    return out
+
+
 def apply(df):
-    df["EMA12"] = df["Close"].ewm(span=12).mean()
-    df["EMA26"] = df["Close"].ewm(span=26).mean()
-    df["MACD"] = df["EMA12"] - df["EMA26"]
-    df["SignalLine"] = df["MACD"].ewm(span=9).mean()
-    df["Signal"] = 0
-    df.loc[df["MACD"] > df["SignalLine"], "Signal"] = 1
-    df.loc[df["MACD"] < df["SignalLine"], "Signal"] = -1
+    if njit is None:
+        df["Signal"] = _macd_signal_pandas(df)
+        return df
+    close = df["Close"].to_numpy(dtype=np.float32)
+    out = np.empty(len(close), dtype=np.int8)
+    _macd_signal(close, 2 / (12 + 1), 2 / (26 + 1), 2 / (9 + 1), out)
+    df["Signal"] = out
     return df
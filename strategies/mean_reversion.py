@@ -1,6 +1,11 @@
+import numpy as np
+
+from strategies._rolling import move_mean, move_std
+
 def apply(df):
-    df["MA20"] = df["Close"].rolling(20).mean()
-    df["STD20"] = df["Close"].rolling(20).std()
+    close = df["Close"].to_numpy(dtype=np.float32)
+    df["MA20"] = move_mean(close, 20)
+    df["STD20"] = move_std(close, 20)
     df["Upper"] = df["MA20"] + (2 * df["STD20"])
     df["Lower"] = df["MA20"] - (2 * df["STD20"])
     df["Signal"] = 0
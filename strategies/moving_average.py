@@ -1,6 +1,11 @@
+import numpy as np
+
+from strategies._rolling import move_mean
+
 def apply(df):
-    df["SMA20"] = df["Close"].rolling(20).mean()
-    df["SMA50"] = df["Close"].rolling(50).mean()
+    close = df["Close"].to_numpy(dtype=np.float32)
+    df["SMA20"] = move_mean(close, 20)
+    df["SMA50"] = move_mean(close, 50)
     df["Signal"] = 0
     df.loc[df["SMA20"] > df["SMA50"], "Signal"] = 1
     df.loc[df["SMA20"] < df["SMA50"], "Signal"] = -1
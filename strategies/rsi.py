@@ -1,11 +1,15 @@
 import pandas as pd
 import numpy as np
 
+from strategies._rolling import move_mean
+
 def apply(df, period=14, low=30, high=70):
-    delta = df["Close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(period).mean()
-    rs = gain / loss
+    close = df["Close"].to_numpy(dtype=np.float32)
+    delta = np.diff(close, prepend=np.float32(np.nan))
+    gain = move_mean(np.where(delta > 0, delta, np.float32(0)), period)
+    loss = move_mean(-np.where(delta < 0, delta, np.float32(0)), period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = gain / loss
     df["RSI"] = 100 - (100 / (1 + rs))
     df["Signal"] = 0
     df.loc[df["RSI"] < low, "Signal"] = 1
@@ -9,16 +9,13 @@ if str(repo_root) not in sys.path:
     sys.path.insert(0, str(repo_root))
 
 import streamlit as st
-import plotly.graph_objects as go
 import importlib
-import pandas as pd
 import io
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from core.data_feed import get_historical_data, get_live_price
-from core.trader import run_backtest
-from core.news_sentiment import get_news_sentiment
 import time
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 st.set_page_config(page_title="OpenTrade Bot", layout="wide")
 
@@ -66,24 +63,90 @@ else:
     st.sidebar.markdown("**Last auto-poll:** Never")
 
 
-# Helper to run the pipeline and render results
-def _run_pipeline():
+# Memoized data/strategy steps so reruns triggered by unrelated widgets
+# (theme, layout, polling) don't refetch or recompute. cache_data hands out
+# copies, so callers may mutate the returned frames freely. A missing or
+# empty download raises LookupError instead of returning None: cache_data
+# does not cache exceptions, so the next run retries the fetch.
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_hist(symbol):
     df = get_historical_data(symbol)
     if df is None or df.empty:
-        st.warning("No data returned for symbol. Check the symbol or network access.")
-        # return five Nones so callers that unpack expect the same shape
-        return None, None, None, None, None
+        raise LookupError(f"no data returned for {symbol}")
+    # OHLC already arrive as float32 from the data feed; shrink the
+    # volume column to the smallest unsigned int that holds it
+    if 'Volume' in df.columns:
+        df['Volume'] = pd.to_numeric(df['Volume'], downcast='unsigned')
+    return df
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def _cached_sent(symbol):
+    return get_news_sentiment(symbol)
+
+
+@st.cache_resource(show_spinner=False)
+def _strategy_module(strategy_name):
+    return importlib.import_module(f"strategies.{strategy_name}")
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_strategy(symbol, strategy_name):
+    # raises LookupError (uncached) via _cached_hist when there is no data
+    return _strategy_module(strategy_name).apply(_cached_hist(symbol))
+
+
+@st.cache_data(show_spinner=False)
+def _trades_csv(trades):
+    """CSV bytes for a trade log given as a tuple of (date, action, price).
+
+    Cached on the trade tuples, so reruns with an unchanged backtest reuse
+    the encoded bytes.
+    """
+    return pd.DataFrame(list(trades), columns=['date', 'action', 'price']).to_csv(index=False).encode('utf-8')
+
 
+@st.cache_data(show_spinner=False)
+def _trades_parquet(trades):
+    """Snappy-compressed Parquet bytes for the same trade tuples as `_trades_csv`.
+
+    Only offered when pyarrow is installed; cached on the trade tuples.
+    """
+    rows = [{'date': d, 'action': a, 'price': p} for d, a, p in trades]
+    buf = io.BytesIO()
+    pa_pq.write_table(pa.Table.from_pylist(rows), buf, compression='snappy')
+    return buf.getvalue()
+
+
+# Helper to run the pipeline and render results
+def _run_pipeline():
+    # Price history and news sentiment are independent network calls, so
+    # fetch them concurrently: the wait becomes max(t_hist, t_sent) instead
+    # of the sum. Worker threads get this script's run context so the
+    # Streamlit caches behave as they do on the main thread.
     # Always fetch recent news sentiment (used for display). If auto-select
     # is enabled, use the sentiment to pick a strategy; otherwise just show it.
     sentiment_info = None
     applied_strategy = strategy_name
-    with st.spinner('Fetching news sentiment...'):
-        try:
-            sentiment_info = get_news_sentiment(symbol)
-        except Exception as e:
-            st.warning(f"News sentiment check failed: {e}")
-            sentiment_info = None
+    ctx = get_script_run_ctx()
+    with st.spinner('Fetching market data and news sentiment...'):
+        with ThreadPoolExecutor(max_workers=2, initializer=add_script_run_ctx, initargs=(None, ctx)) as pool:
+            hist_future = pool.submit(_cached_hist, symbol)
+            sent_future = pool.submit(_cached_sent, symbol)
+            try:
+                df = hist_future.result()
+            except LookupError:
+                df = None
+            try:
+                sentiment_info = sent_future.result()
+            except Exception as e:
+                st.warning(f"News sentiment check failed: {e}")
+                sentiment_info = None
+
+    if df is None:
+        st.warning("No data returned for symbol. Check the symbol or network access.")
+        # return five Nones so callers that unpack expect the same shape
+        return None, None, None, None, None
 
     if auto_strategy and sentiment_info is not None:
         label = sentiment_info.get('label')
@@ -96,12 +159,13 @@ def _run_pipeline():
     # sentiment_info is returned and will be rendered by the main UI so the
     # pipeline remains side-effect free (no direct st.* calls here).
 
-    if applied_strategy != strategy_name:
-        st.info(f"Strategy auto-selected based on news: {applied_strategy}")
-
     # Apply strategy and run backtest
-    strategy = importlib.import_module(f"strategies.{applied_strategy}")
-    df2 = strategy.apply(df)
+    try:
+        df2 = _cached_strategy(symbol, applied_strategy)
+    except LookupError:
+        # the history cache entry expired between the two calls and the refetch failed
+        st.warning("No data returned for symbol. Check the symbol or network access.")
+        return None, None, None, None, None
     portfolio, final_value = run_backtest(df2, initial_capital=float(initial_capital))
     return df2, portfolio, final_value, sentiment_info, applied_strategy
 
@@ -112,13 +176,43 @@ if not should_run:
     st.info('Adjust inputs in the sidebar and click "Run backtest" or enable "Auto-run on change"')
     st.stop()
 
-# Run the pipeline
-df, portfolio, final_value, sentiment_info, applied_strategy = _run_pipeline()
-if df is None:
-    st.stop()
-
+# Heavy imports (plotly, pandas, and yfinance via core.*) are deferred until
+# we know the pipeline will run, so the idle page above never pays for them.
+# The functions defined earlier only look these names up when called.
+import plotly.graph_objects as go
+import pandas as pd
+import numpy as np
+from core.data_feed import get_historical_data, get_live_price
+from core.trader import run_backtest
+from core.news_sentiment import get_news_sentiment
 
-# Helper: detect NSE market open now (module-level so usable before rendering)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pa_pq
+except ImportError:  # pyarrow is optional; without it only CSV export is offered
+    pa = None
+
+# Run the pipeline only when its inputs change (or on an explicit "Run
+# backtest"); UI-only changes such as theme or summary position reuse the
+# previous results from session_state. Failed runs are not kept.
+pipeline_key = (symbol, strategy_name, float(initial_capital), auto_strategy)
+if st.session_state.get('pipeline_key') != pipeline_key or run_backtest_now:
+    results = _run_pipeline()
+    if results[0] is None:
+        st.session_state.pop('pipeline_key', None)
+        st.stop()
+    st.session_state['pipeline_results'] = results
+    st.session_state['pipeline_key'] = pipeline_key
+    # chart decimation belongs to the previous results
+    st.session_state.pop('chart_keep', None)
+df, portfolio, final_value, sentiment_info, applied_strategy = st.session_state['pipeline_results']
+
+if applied_strategy != strategy_name:
+    st.info(f"Strategy auto-selected based on news: {applied_strategy}")
+
+
+# Helper: detect NSE market open now (09:15-15:30 IST, Mon-Fri). Module-level
+# so the auto-poll check, the positions fragment and the card share it.
 def _is_market_open_now(now_ts: datetime | None = None) -> bool:
     try:
         now = now_ts or datetime.now(ZoneInfo('Asia/Kolkata'))
@@ -135,8 +229,10 @@ def _is_market_open_now(now_ts: datetime | None = None) -> bool:
 # the app at intervals controlled by `refresh_interval`. We use a session
 # key `last_poll_time` and call `st.experimental_rerun()` to trigger a re-run
 # which will re-fetch live data. This avoids polling while the market is closed.
+# With `st.fragment` available (Streamlit >= 1.33) polling is handled by the
+# positions fragment in `_render_summary` and this full-page rerun is skipped.
 try:
-    if use_live_price and _is_market_open_now():
+    if use_live_price and not hasattr(st, 'fragment') and _is_market_open_now():
         last = st.session_state.get('last_poll_time', 0.0)
         now_ts = time.time()
         # if enough time has passed, update timestamp and rerun
@@ -177,89 +273,93 @@ def _portfolio_snapshot(portfolio, last_price):
     except Exception:
         snapshot['last_price'] = None
 
-    trades = list(getattr(portfolio, 'trade_log', []) or [])
-    realized = 0.0
-    open_buy_price = None
-    for t in trades:
-        try:
-            _date, action, price = t[0], t[1], float(t[2])
-        except Exception:
-            continue
-        if action == 'BUY':
-            open_buy_price = price
-        elif action == 'SELL' and open_buy_price is not None:
-            # approximate implied qty from initial capital at buy time
-            try:
-                implied_qty = float(initial_capital) / open_buy_price
-            except Exception:
-                implied_qty = 1.0
-            realized += (price - open_buy_price) * implied_qty
-            open_buy_price = None
-
-    snapshot['realized_pl'] = realized
+    tdf = pd.DataFrame(list(getattr(portfolio, 'trade_log', []) or []), columns=['date', 'action', 'price'])
+    tdf['price'] = pd.to_numeric(tdf['price'], errors='coerce')
+    tdf = tdf.dropna(subset=['price'])
+    # stable sort by action ('BUY' < 'SELL') keeps each side in trade order
+    # and leaves them as two contiguous slices, so no per-side masks
+    actions = tdf['action'].to_numpy(dtype=str)
+    order = np.argsort(actions, kind='stable')
+    prices = tdf['price'].to_numpy(dtype=np.float64)[order]
+    split = np.searchsorted(actions[order], 'BUY', side='right')
+    buys, sells = prices[:split], prices[split:]
+
+    # the backtester alternates BUY/SELL, so the i-th SELL closes the i-th
+    # BUY; approximate implied qty from initial capital at buy time
+    n = min(len(buys), len(sells))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        qty = float(initial_capital) / buys[:n]
+    qty[~np.isfinite(qty)] = 1.0
+    snapshot['realized_pl'] = float(((sells[:n] - buys[:n]) * qty).sum())
 
     # open position -> derive entry and unrealized
-    if getattr(portfolio, 'position', 0):
-        last_buy = None
-        for t in reversed(trades):
-            try:
-                if t[1] == 'BUY':
-                    last_buy = float(t[2])
-                    break
-            except Exception:
-                continue
-        if last_buy is not None:
-            qty = float(portfolio.position)
-            snapshot['position_qty'] = qty
-            snapshot['entry_price'] = last_buy
-            if snapshot['last_price'] is not None:
-                snapshot['unrealized_pl'] = (snapshot['last_price'] - last_buy) * qty
-
-    if trades:
-        try:
-            snapshot['last_update'] = str(trades[-1][0])
-        except Exception:
-            snapshot['last_update'] = None
+    if getattr(portfolio, 'position', 0) and len(buys):
+        last_buy = float(buys[-1])
+        qty = float(portfolio.position)
+        snapshot['position_qty'] = qty
+        snapshot['entry_price'] = last_buy
+        if snapshot['last_price'] is not None:
+            snapshot['unrealized_pl'] = (snapshot['last_price'] - last_buy) * qty
+
+    if not tdf.empty:
+        snapshot['last_update'] = str(tdf['date'].iloc[-1])
 
     return snapshot
 
 
-def _render_summary(df, portfolio, final_value, initial_capital, applied_strategy, sentiment_info, trades_df, symbol, use_live_price=False):
-    """Render the Summary widget (KPIs, positions, trade log download/preview).
+@st.cache_data(show_spinner=False)
+def _headlines_df(hs):
+    """Headline scores as a DataFrame with `pubDate` first (cached per headlines)."""
+    df_hs = pd.DataFrame(list(hs))
+    if 'pubDate' in df_hs.columns:
+        cols = ['pubDate'] + [c for c in df_hs.columns if c != 'pubDate']
+        df_hs = df_hs[cols]
+    return df_hs
 
-    This function is independent of page layout so we can place the summary
-    at the top or bottom of the page.
-    """
-    # Top-line KPIs
-    try:
-        init_cap = float(initial_capital)
-    except Exception:
-        init_cap = None
-
-    try:
-        final_val = float(final_value)
-    except Exception:
-        final_val = None
 
-    try:
-        total_return = None if init_cap in (None, 0) or final_val is None else (final_val - init_cap) / init_cap * 100.0
-    except Exception:
-        total_return = None
+def _render_headlines(sentiment_info):
+    """Render headline scores (or raw headlines) and major events.
 
-    k1, k2, k3 = st.columns(3)
-    k1.metric(label="Initial Capital (₹)", value=f"{init_cap:,.2f}" if init_cap is not None else "N/A")
-    if final_val is not None:
-        k2.metric(label="Final Portfolio Value (₹)", value=f"{final_val:,.2f}", delta=f"{(final_val - init_cap):+.2f}" if init_cap is not None else None)
-    else:
-        k2.metric(label="Final Portfolio Value (₹)", value="N/A")
-    if total_return is not None:
-        k3.metric(label="Total Return", value=f"{total_return:.2f}%", delta=f"{total_return:+.2f}%")
+    Shared by the summary and the news modal/expander.
+    """
+    hs = sentiment_info.get('headline_scores') or []
+    if hs:
+        try:
+            st.dataframe(_headlines_df(tuple(hs)), use_container_width=True)
+        except Exception:
+            for item in hs:
+                title = item.get('headline') or item.get('title')
+                pub = item.get('pubDate')
+                if pub:
+                    st.write(f"- {title} (score={item.get('score')}) — {pub}")
+                else:
+                    st.write(f"- {title} (score={item.get('score')})")
     else:
-        k3.metric(label="Total Return", value="N/A")
+        heads = sentiment_info.get('headlines') or []
+        if heads:
+            for h in heads:
+                if isinstance(h, dict):
+                    title = h.get('title') or h.get('headline')
+                    pub = h.get('pubDate')
+                    if pub:
+                        st.write(f"- {title} — {pub}")
+                    else:
+                        st.write(f"- {title}")
+                else:
+                    st.write('-', h)
+
+    ev = sentiment_info.get('events') or []
+    if ev:
+        st.markdown('---')
+        try:
+            st.dataframe(pd.DataFrame(ev), use_container_width=True)
+        except Exception:
+            for e in ev:
+                st.write(f"- {e.get('event')}: {e.get('value')}")
 
-    st.markdown("---")
 
-    # Live positions & P&L card
+def _render_positions(df, portfolio, symbol, use_live_price=False):
+    """Render the live positions & P&L card (also used as a polling fragment)."""
     st.markdown("### Live positions & P&L")
     # Determine the price to use for P&L: live override or last historical close
     last_price = None
@@ -273,31 +373,18 @@ def _render_summary(df, portfolio, final_value, initial_capital, applied_strateg
         except Exception as e:
             # fallback to historical close
             try:
-                last_price = df['Close'].iloc[-1]
+                last_price = float(df['Close'].to_numpy()[-1])
             except Exception:
                 last_price = None
     else:
         try:
-            last_price = df['Close'].iloc[-1]
+            last_price = float(df['Close'].to_numpy()[-1])
         except Exception:
             last_price = None
 
     snap = _portfolio_snapshot(portfolio, last_price)
 
-    # Market open/closed helper (NSE 09:15-15:30 IST, Mon-Fri)
-    def _is_market_open(now_ts: datetime | None = None) -> bool:
-        try:
-            now = now_ts or datetime.now(ZoneInfo('Asia/Kolkata'))
-        except Exception:
-            now = datetime.now()
-        # weekend
-        if now.weekday() >= 5:
-            return False
-        open_time = now.replace(hour=9, minute=15, second=0, microsecond=0)
-        close_time = now.replace(hour=15, minute=30, second=0, microsecond=0)
-        return open_time <= now <= close_time
-
-    market_open = _is_market_open()
+    market_open = _is_market_open_now()
 
     if snap.get('position_qty') and snap.get('entry_price') is not None:
         pcol1, pcol2 = st.columns([1, 1])
@@ -340,55 +427,69 @@ def _render_summary(df, portfolio, final_value, initial_capital, applied_strateg
     else:
         st.info('No open positions.')
 
+
+def _render_summary(df, portfolio, final_value, initial_capital, applied_strategy, sentiment_info, trades_df, symbol, use_live_price=False):
+    """Render the Summary widget (KPIs, positions, trade log download/preview).
+
+    This function is independent of page layout so we can place the summary
+    at the top or bottom of the page.
+    """
+    # Top-line KPIs
+    try:
+        init_cap = float(initial_capital)
+    except Exception:
+        init_cap = None
+
+    try:
+        final_val = float(final_value)
+    except Exception:
+        final_val = None
+
+    try:
+        total_return = None if init_cap in (None, 0) or final_val is None else (final_val - init_cap) / init_cap * 100.0
+    except Exception:
+        total_return = None
+
+    k1, k2, k3 = st.columns(3)
+    k1.metric(label="Initial Capital (₹)", value=f"{init_cap:,.2f}" if init_cap is not None else "N/A")
+    if final_val is not None:
+        k2.metric(label="Final Portfolio Value (₹)", value=f"{final_val:,.2f}", delta=f"{(final_val - init_cap):+.2f}" if init_cap is not None else None)
+    else:
+        k2.metric(label="Final Portfolio Value (₹)", value="N/A")
+    if total_return is not None:
+        k3.metric(label="Total Return", value=f"{total_return:.2f}%", delta=f"{total_return:+.2f}%")
+    else:
+        k3.metric(label="Total Return", value="N/A")
+
+    st.markdown("---")
+
+    # Live positions & P&L card. While polling a live quote during market
+    # hours, the card runs as a timed fragment so only it re-executes each
+    # tick instead of the whole script (fetch, backtest, chart).
+    if use_live_price and hasattr(st, 'fragment') and _is_market_open_now():
+        @st.fragment(run_every=float(refresh_interval))
+        def _live_positions():
+            st.session_state['last_poll_time'] = time.time()
+            _render_positions(df, portfolio, symbol, use_live_price)
+
+        _live_positions()
+    else:
+        _render_positions(df, portfolio, symbol, use_live_price)
+
     st.markdown('---')
 
     # Trade log download and compact preview
     # Headlines & Major events (show here above the trade log download)
     if sentiment_info is not None:
         st.subheader('Headlines & Major events')
-        hs = sentiment_info.get('headline_scores') or []
-        if hs:
-            try:
-                df_hs = pd.DataFrame(hs)
-                if 'pubDate' in df_hs.columns:
-                    cols = ['pubDate'] + [c for c in df_hs.columns if c != 'pubDate']
-                    df_hs = df_hs[cols]
-                st.dataframe(df_hs, use_container_width=True)
-            except Exception:
-                for item in hs:
-                    title = item.get('headline') or item.get('title')
-                    pub = item.get('pubDate')
-                    if pub:
-                        st.write(f"- {title} (score={item.get('score')}) — {pub}")
-                    else:
-                        st.write(f"- {title} (score={item.get('score')})")
-        else:
-            heads = sentiment_info.get('headlines') or []
-            if heads:
-                for h in heads:
-                    if isinstance(h, dict):
-                        title = h.get('title') or h.get('headline')
-                        pub = h.get('pubDate')
-                        if pub:
-                            st.write(f"- {title} — {pub}")
-                        else:
-                            st.write(f"- {title}")
-                    else:
-                        st.write('-', h)
-
-        ev = sentiment_info.get('events') or []
-        if ev:
-            st.markdown('---')
-            try:
-                st.dataframe(pd.DataFrame(ev), use_container_width=True)
-            except Exception:
-                for e in ev:
-                    st.write(f"- {e.get('event')}: {e.get('value')}")
+        _render_headlines(sentiment_info)
 
     if not trades_df.empty:
         try:
-            csv_bytes = trades_df.to_csv(index=False).encode('utf-8')
-            st.download_button(label="Download trade log (CSV)", data=csv_bytes, file_name=f"{symbol}_trade_log.csv", mime='text/csv')
+            trades = tuple(map(tuple, portfolio.trade_log))
+            if pa is not None:
+                st.download_button(label="Download trade log (Parquet)", data=_trades_parquet(trades), file_name=f"{symbol}_trade_log.parquet", mime='application/octet-stream')
+            st.download_button(label="Download trade log (CSV)", data=_trades_csv(trades), file_name=f"{symbol}_trade_log.csv", mime='text/csv')
         except Exception:
             st.write('Trade log available in-memory; download not available.')
         # Note: detailed trade log preview intentionally omitted from Summary
@@ -398,30 +499,116 @@ def _render_summary(df, portfolio, final_value, initial_capital, applied_strateg
     else:
         st.write('No trades executed in this backtest.')
 
-# Build the price chart and annotate buys/sells
-fig = go.Figure()
-fig.add_trace(go.Scatter(x=df.index, y=df["Close"], mode="lines", name="Price", line=dict(color="#00FFFF")))
-
-# convert trade_log to DataFrame for plotting and display
-trade_rows = []
-for t in getattr(portfolio, 'trade_log', []):
-    # expect tuple(date, action, price)
-    try:
-        trade_rows.append({'date': t[0], 'action': t[1], 'price': t[2]})
-    except Exception:
-        pass
 
-trades_df = pd.DataFrame(trade_rows)
-if not trades_df.empty:
-    buys = trades_df[trades_df['action'] == 'BUY']
-    sells = trades_df[trades_df['action'] == 'SELL']
-    if not buys.empty:
-        fig.add_trace(go.Scatter(x=buys['date'], y=buys['price'], mode='markers', name='BUY', marker=dict(symbol='triangle-up', color='green', size=10)))
-    if not sells.empty:
-        fig.add_trace(go.Scatter(x=sells['date'], y=sells['price'], mode='markers', name='SELL', marker=dict(symbol='triangle-down', color='red', size=10)))
+def _minmax_lttb(y, n_out, minmax_ratio=4, slack=0.25):
+    """Return indices of about `n_out` points that preserve the shape of `y`.
 
-fig.update_layout(template="plotly_dark" if theme == "dark" else "plotly_white",
-                  paper_bgcolor=bg_color, plot_bgcolor=bg_color, font_color=text_color)
+    MinMaxLTTB: keep the min and max of `n_out * minmax_ratio / 2` equal
+    buckets (cheap, vectorized), then run Largest-Triangle-Three-Buckets
+    over those candidates to pick the final points. The first and last
+    points are always kept. Bar positions serve as the x coordinate.
+    When the series or the candidate set is within `slack` (a fraction of
+    `n_out`) of the budget it is returned as is: the Python LTTB loop
+    costs far more than shipping a few extra points.
+    """
+    n = len(y)
+    limit = int(n_out * (1 + slack))
+    if n <= limit or n_out < 3:
+        return np.arange(n)
+
+    # min/max preselection over the interior points
+    interior = y[1:-1]
+    n_buckets = max(1, min(len(interior), n_out * minmax_ratio // 2))
+    size = -(-len(interior) // n_buckets)
+    padded = np.pad(interior, (0, n_buckets * size - len(interior)), mode='edge').reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size + 1
+    cand = np.unique(np.concatenate((
+        [0], padded.argmin(axis=1) + offsets, padded.argmax(axis=1) + offsets, [n - 1],
+    )))
+    cand = cand[cand < n]
+    if len(cand) <= limit:
+        return cand
+
+    # LTTB over the candidates
+    cx = cand.astype(np.float64)
+    cy = y[cand].astype(np.float64)
+    edges = np.linspace(1, len(cand) - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            nxt = slice(hi, edges[i + 2])
+            avg_x, avg_y = cx[nxt].mean(), cy[nxt].mean()
+        else:
+            avg_x, avg_y = cx[-1], cy[-1]
+        area = np.abs((cx[a] - avg_x) * (cy[lo:hi] - cy[a]) - (cx[a] - cx[lo:hi]) * (avg_y - cy[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    out[-1] = len(cand) - 1
+    return cand[out]
+
+
+# Build the price chart and annotate buys/sells. Long series are drawn with
+# WebGL (Scattergl) instead of one SVG node per point; short ones stay on
+# SVG to skip the WebGL context setup.
+_WEBGL_MIN_POINTS = 2000
+Trace = go.Scattergl if len(df) >= _WEBGL_MIN_POINTS else go.Scatter
+
+# ship at most ~_CHART_MAX_POINTS points of the Close line to the browser;
+# trade markers are sparse and always drawn in full.
+_CHART_MAX_POINTS = 2000
+closes = df["Close"].to_numpy()
+# decimated once per pipeline result; theme/layout reruns reuse it
+keep = st.session_state.get('chart_keep')
+if keep is None:
+    keep = st.session_state['chart_keep'] = _minmax_lttb(closes, _CHART_MAX_POINTS)
+
+# convert trade_log (tuples of date, action, price) to a DataFrame for
+# plotting and display in one constructor call
+trades_df = pd.DataFrame(list(getattr(portfolio, 'trade_log', [])), columns=['date', 'action', 'price'])
+trades_df['price'] = pd.to_numeric(trades_df['price'], errors='coerce')
+trades_df = trades_df.dropna(subset=['price'])
+# compact dtypes: halves what goes through the Plotly JSON encoder
+trades_df['price'] = trades_df['price'].astype('float32')
+trades_df['action'] = trades_df['action'].astype('category')
+# BUY and SELL markers share one trace (one render pass) and are told
+# apart by per-point symbol/color arrays
+is_buy = trades_df['action'].eq('BUY').to_numpy()
+
+
+@st.cache_resource(show_spinner=False)
+def _layout(theme, bg_color, text_color):
+    """Themed go.Layout, built once per theme and page colours.
+
+    Resolving a named template is the expensive part of styling a figure;
+    go.Figure copies the layout it is given, so the cached one stays clean.
+    """
+    return go.Layout(template="plotly_dark" if theme == "dark" else "plotly_white",
+                     paper_bgcolor=bg_color, plot_bgcolor=bg_color,
+                     font=dict(color=text_color))
+
+
+# The figure is kept in session_state and only its trace data is swapped on
+# reruns, so Plotly.js can diff-update the existing chart instead of
+# rebuilding it. It is rebuilt only when the trace type or theme changes.
+fig_signature = (Trace.__name__, theme)
+fig = st.session_state.get('price_fig')
+if fig is None or st.session_state.get('price_fig_signature') != fig_signature:
+    fig = go.Figure(layout=_layout(theme, bg_color, text_color))
+    fig.add_trace(Trace(mode="lines", name="Price", line=dict(color="#00FFFF")))
+    fig.add_trace(Trace(mode='markers', name='Trades', marker=dict(size=10)))
+    st.session_state['price_fig'] = fig
+    st.session_state['price_fig_signature'] = fig_signature
+
+price_trace, trade_trace = fig.data
+price_trace.x, price_trace.y = df.index[keep], closes[keep]
+trade_trace.x, trade_trace.y = trades_df['date'], trades_df['price']
+trade_trace.text = trades_df['action'].astype(str)
+trade_trace.marker.symbol = np.where(is_buy, 'triangle-up', 'triangle-down')
+trade_trace.marker.color = np.where(is_buy, 'green', 'red')
+trade_trace.showlegend = not trades_df.empty
 
 # Render news sentiment as a static label (no click-to-open)
 if sentiment_info is not None:
@@ -433,7 +620,7 @@ if sentiment_info is not None:
         st.write(f"**News sentiment:** **{label.capitalize()}** (score={score:.2f})")
 
 # Main chart
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(fig, use_container_width=True, key="price_chart")
 
 # Render summary after the chart
 _render_summary(df, portfolio, final_value, initial_capital, applied_strategy, sentiment_info, trades_df, symbol, use_live_price=use_live_price)
@@ -448,43 +635,7 @@ if st.session_state.get(f"news_modal_{symbol}", False):
             # render content inside the native modal
             if sentiment_info is not None:
                 st.markdown(f"### Sentiment: **{sentiment_info.get('label')}** (score={sentiment_info.get('score'):.2f})")
-                hs = sentiment_info.get('headline_scores') or []
-                if hs:
-                    try:
-                        df_hs = pd.DataFrame(hs)
-                        if 'pubDate' in df_hs.columns:
-                            cols = ['pubDate'] + [c for c in df_hs.columns if c != 'pubDate']
-                            df_hs = df_hs[cols]
-                        st.dataframe(df_hs, use_container_width=True)
-                    except Exception:
-                        for item in hs:
-                            title = item.get('headline') or item.get('title')
-                            pub = item.get('pubDate')
-                            if pub:
-                                st.write(f"- {title} (score={item.get('score')}) — {pub}")
-                            else:
-                                st.write(f"- {title} (score={item.get('score')})")
-                else:
-                    heads = sentiment_info.get('headlines') or []
-                    if heads:
-                        for h in heads:
-                            if isinstance(h, dict):
-                                title = h.get('title') or h.get('headline')
-                                pub = h.get('pubDate')
-                                if pub:
-                                    st.write(f"- {title} — {pub}")
-                                else:
-                                    st.write(f"- {title}")
-                            else:
-                                st.write('-', h)
-                ev = sentiment_info.get('events') or []
-                if ev:
-                    st.markdown('---')
-                    try:
-                        st.dataframe(pd.DataFrame(ev), use_container_width=True)
-                    except Exception:
-                        for e in ev:
-                            st.write(f"- {e.get('event')}: {e.get('value')}")
+                _render_headlines(sentiment_info)
             if st.button('Close', key=f'close_news_top_{symbol}'):
                 st.session_state[f"news_modal_{symbol}"] = False
     else:
@@ -496,43 +647,7 @@ if st.session_state.get(f"news_modal_{symbol}", False):
         with st.expander(f"News & Sentiment — {symbol}", expanded=True):
             if sentiment_info is not None:
                 st.markdown(f"### Sentiment: **{sentiment_info.get('label')}** (score={sentiment_info.get('score'):.2f})")
-                hs = sentiment_info.get('headline_scores') or []
-                if hs:
-                    try:
-                        df_hs = pd.DataFrame(hs)
-                        if 'pubDate' in df_hs.columns:
-                            cols = ['pubDate'] + [c for c in df_hs.columns if c != 'pubDate']
-                            df_hs = df_hs[cols]
-                        st.dataframe(df_hs, use_container_width=True)
-                    except Exception:
-                        for item in hs:
-                            title = item.get('headline') or item.get('title')
-                            pub = item.get('pubDate')
-                            if pub:
-                                st.write(f"- {title} (score={item.get('score')}) — {pub}")
-                            else:
-                                st.write(f"- {title} (score={item.get('score')})")
-                else:
-                    heads = sentiment_info.get('headlines') or []
-                    if heads:
-                        for h in heads:
-                            if isinstance(h, dict):
-                                title = h.get('title') or h.get('headline')
-                                pub = h.get('pubDate')
-                                if pub:
-                                    st.write(f"- {title} — {pub}")
-                                else:
-                                    st.write(f"- {title}")
-                            else:
-                                st.write('-', h)
-                ev = sentiment_info.get('events') or []
-                if ev:
-                    st.markdown('---')
-                    try:
-                        st.dataframe(pd.DataFrame(ev), use_container_width=True)
-                    except Exception:
-                        for e in ev:
-                            st.write(f"- {e.get('event')}: {e.get('value')}")
+                _render_headlines(sentiment_info)
 
         # (No popup overlay - details intentionally omitted per user preference)
         if st.button('Close', key=f'close_news_top_{symbol}'):